@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+'''
+Import-time profiling report for the API and worker entry points.
+
+Runs each module in a fresh interpreter with `python -X importtime` and prints
+the total import time and the slowest imports (cumulative, including children).
+Modules the interpreter imports on its own (`python -c pass`: site, encodings,
+...) are left out, so the total is only what importing the module costs.
+
+python scripts/import_time_report.py [module ...] [--top N]
+'''
+DEFAULT_MODULES = ["src.database.main", "src.worker.worker"]
+
+def profile_imports(code: str) -> list[tuple[int, int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise Exception(f"Error running {code!r}: {result.stderr.strip().splitlines()[-1]}")
+
+    # lines look like: "import time:  self [us] | cumulative | imported package"
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+def print_report(module: str, top: int, startup_modules: set[str]):
+    rows = [row for row in profile_imports(f"import {module}") if row[2].strip() not in startup_modules]
+    # top-level imports have no indentation, so their cumulative times sum to the total
+    total_us = sum(cumulative for _, cumulative, name in rows if not name.startswith("  "))
+
+    print(f"{module}: {total_us / 1000:.1f} ms total")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name.strip()}")
+    print()
+
+def main(argv: list[str]):
+    top = 20
+    if "--top" in argv:
+        index = argv.index("--top")
+        top = int(argv[index + 1])
+        argv = argv[:index] + argv[index + 2:]
+
+    startup_modules = {name.strip() for _, _, name in profile_imports("pass")}
+    for module in argv or DEFAULT_MODULES:
+        print_report(module, top, startup_modules)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
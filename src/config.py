@@ -0,0 +1,24 @@
+import os
+from dotenv import load_dotenv
+
+# .env is read once per process here; other modules import their settings from this file
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+RIOT_API_KEY = os.getenv("RIOT_API_KEY")
+
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+TWILIO_MY_NUMBER = os.getenv("TWILIO_MY_NUMBER")
+TWILIO_VIRTUAL_NUMBER = os.getenv("TWILIO_VIRTUAL_NUMBER")
+
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+
+POLL_INTERVAL_SECONDS = float(os.getenv("POLL_INTERVAL_SECONDS", "10"))
+WORKER_QUEUE_SIZE = int(os.getenv("WORKER_QUEUE_SIZE", "100"))
+WORKER_FETCH_THREADS = int(os.getenv("WORKER_FETCH_THREADS", "4"))
+
+EVENT_BATCH_SIZE = int(os.getenv("EVENT_BATCH_SIZE", "100"))
+EVENT_POLL_SECONDS = float(os.getenv("EVENT_POLL_SECONDS", "2"))
+EVENT_SETTLE_SECONDS = float(os.getenv("EVENT_SETTLE_SECONDS", "5"))
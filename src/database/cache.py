@@ -0,0 +1,171 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy import inspect
+from src.database import models
+from src.database.database import SessionLocal
+from src.database.events import read_kda_events, latest_kda_event_id
+from src.config import CACHE_TTL_SECONDS, CACHE_MAX_SIZE, EVENT_BATCH_SIZE, EVENT_POLL_SECONDS
+
+_MISSING = object()
+
+'''
+In-process read-through cache for hot lookups (users by auth_id, riot profiles
+and kda logs by riot_profile_id).
+
+Entries are column snapshots (plain dicts), never live ORM objects, so they are
+safe to share between sessions. When an endpoint needs an ORM object the
+snapshot is re-attached to the request's session without a SELECT.
+
+Writes in this process invalidate entries directly. Writes from the polling
+worker are seen through the kda_events outbox: each API process tails it
+(invalidate_from_kda_events) and drops the entries of every profile with a new
+match, a few seconds after the worker commits. Anything not covered by an event
+(e.g. last_checked) is only refreshed once the TTL expires. Cached values are for reads only, never
+base a write on one.
+
+Invalidation runs after the write commits, so a lookup that missed and read the
+old row just before the commit could store it again right after. Every
+invalidate bumps the cache's generation, and a miss only stores its result if
+the generation is unchanged since before it queried.
+'''
+class TTLCache:
+    def __init__(self, name: str, maxsize: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL_SECONDS):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return _MISSING
+
+    def set(self, key, value, generation: Optional[int] = None):
+        with self._lock:
+            # something was invalidated while the value was being loaded, it may be stale
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+user_cache = TTLCache("users")
+riot_profile_cache = TTLCache("riot_profiles")
+kda_log_cache = TTLCache("kda_logs")
+
+
+def snapshot(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+def _attach(db: Session, model, values: dict):
+    # reuse the instance if this session already loaded it
+    existing = db.identity_map.get(db.identity_key(model, values["id"]))
+    if existing is not None:
+        return existing
+
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    db.add(obj)
+    return obj
+
+def get_user_by_auth_id(db: Session, auth_id: str):
+    values = user_cache.get(auth_id)
+    if values is not _MISSING:
+        return _attach(db, models.User, values)
+
+    generation = user_cache.generation
+    user = db.query(models.User).filter(models.User.auth_id == auth_id).first()
+    if user:
+        user_cache.set(auth_id, snapshot(user), generation)
+    return user
+
+def get_riot_profile(db: Session, riot_profile_id: int):
+    values = riot_profile_cache.get(riot_profile_id)
+    if values is not _MISSING:
+        return _attach(db, models.RiotProfile, values)
+
+    generation = riot_profile_cache.generation
+    riot_profile = db.query(models.RiotProfile).filter(models.RiotProfile.id == riot_profile_id).first()
+    if riot_profile:
+        riot_profile_cache.set(riot_profile_id, snapshot(riot_profile), generation)
+    return riot_profile
+
+def get_kda_log(db: Session, riot_profile_id: int) -> Optional[dict]:
+    values = kda_log_cache.get(riot_profile_id)
+    if values is not _MISSING:
+        return values
+
+    generation = kda_log_cache.generation
+    log = db.query(models.KDALog).filter(models.KDALog.riot_profile_id == riot_profile_id).first()
+    if not log:
+        return None
+    values = snapshot(log)
+    kda_log_cache.set(riot_profile_id, values, generation)
+    return values
+
+def invalidate_riot_profile(riot_profile_id: int):
+    riot_profile_cache.invalidate(riot_profile_id)
+    kda_log_cache.invalidate(riot_profile_id)
+
+def cache_stats() -> dict:
+    return {cache.name: cache.stats() for cache in (user_cache, riot_profile_cache, kda_log_cache)}
+
+def invalidate_from_kda_events(stop_event: threading.Event, interval: float = EVENT_POLL_SECONDS):
+    # the cache starts empty, so only events after startup matter; the cursor is kept in memory
+    last_event_id = None
+    while not stop_event.is_set():
+        events = []
+        db = SessionLocal()
+        try:
+            # retried every interval until the db (and the kda_events table) is reachable
+            if last_event_id is None:
+                last_event_id = latest_kda_event_id(db)
+            events = read_kda_events(db, last_event_id, EVENT_BATCH_SIZE)
+            for event in events:
+                invalidate_riot_profile(event.riot_profile_id)
+            if events:
+                last_event_id = events[-1].id
+        except Exception as e:
+            print(f"[Cache] kda_events invalidation failed: {e}")
+        finally:
+            db.close()
+        if len(events) < EVENT_BATCH_SIZE:
+            stop_event.wait(interval)
@@ -1,10 +1,6 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-DATABASE_URL = os.getenv('DATABASE_URL')
+from src.config import DATABASE_URL
 
 engine = create_engine(DATABASE_URL)
 
@@ -0,0 +1,53 @@
+from datetime import timedelta
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.database import models
+from src.config import EVENT_SETTLE_SECONDS
+
+'''
+Outbox for "match ingested" events (kda_events).
+
+Events are only ever appended, in the same transaction as the kda_logs write.
+Consumers tail the table in id order and store how far they got in
+event_cursors, so each consumer handles every event at least once.
+
+Ids are assigned on insert but transactions can commit out of order, so
+readers skip events newer than EVENT_SETTLE_SECONDS; otherwise a late commit
+could land behind a cursor that has already moved past it. created_at and the
+cutoff both come from the database clock, so skew between hosts doesn't matter.
+statement_timestamp() is used rather than now(), which is the transaction's
+start: the API writes events at the end of transactions that also made Riot
+calls, and now() would date those events seconds before their insert.
+'''
+def append_kda_event(db: Session, riot_profile_id: int, info: dict, previous_kda_ratio: Optional[float]):
+    event = models.KDAEvent(
+        riot_profile_id=riot_profile_id,
+        match_id=info["match_id"],
+        kda_ratio=info["kda"],
+        previous_kda_ratio=previous_kda_ratio,
+        timestamp=info["timestamp"],
+    )
+    db.add(event)
+    return event
+
+def read_kda_events(db: Session, after_id: int, limit: int, riot_profile_id: Optional[int] = None) -> list[models.KDAEvent]:
+    settled_before = func.statement_timestamp() - timedelta(seconds=EVENT_SETTLE_SECONDS)
+    query = (db.query(models.KDAEvent)
+             .filter(models.KDAEvent.id > after_id)
+             .filter(models.KDAEvent.created_at <= settled_before))
+    if riot_profile_id is not None:
+        query = query.filter(models.KDAEvent.riot_profile_id == riot_profile_id)
+    return query.order_by(models.KDAEvent.id).limit(limit).all()
+
+def latest_kda_event_id(db: Session) -> int:
+    return db.query(func.max(models.KDAEvent.id)).scalar() or 0
+
+def get_cursor(db: Session, consumer: str) -> models.EventCursor:
+    # row lock keeps two instances of the same consumer from handling an event twice;
+    # populate_existing so a session that already holds the cursor sees the latest value
+    cursor = db.get(models.EventCursor, consumer, with_for_update=True, populate_existing=True)
+    if not cursor:
+        cursor = models.EventCursor(consumer=consumer, last_event_id=0)
+        db.add(cursor)
+    return cursor
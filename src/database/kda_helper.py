@@ -1,11 +1,8 @@
 from datetime import datetime, timezone
 from src.database import models
+from src.database.events import append_kda_event
 from src.negative_lol.riot_get_info import get_all_from_names
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-api_key = os.getenv("RIOT_API_KEY")
+from src.config import RIOT_API_KEY as api_key
 
 def create_kda_log_for_profile(riot_profile: models.RiotProfile, db):
     info = get_all_from_names(
@@ -24,6 +21,7 @@ def create_kda_log_for_profile(riot_profile: models.RiotProfile, db):
     riot_profile.last_checked = datetime.now(timezone.utc)
 
     db.add(kda_log)
+    append_kda_event(db, riot_profile.id, info, previous_kda_ratio=None)
     db.commit()
     db.refresh(kda_log)
     return kda_log
@@ -35,11 +33,18 @@ def update_kda_log_for_profile(riot_profile: models.RiotProfile, db):
         riot_profile.region,
         api_key,
     )
+    return save_kda_log_for_profile(riot_profile, info, db)
 
+# writes already-fetched match info, so the worker can fetch outside a db session
+def save_kda_log_for_profile(riot_profile: models.RiotProfile, info: dict, db):
     log = db.query(models.KDALog).filter_by(riot_profile_id=riot_profile.id).first()
     if not log:
         raise ValueError("No KDA log exists for this profile")
 
+    # the event is committed in the same transaction as the log update, so no new match is missed
+    if info["match_id"] != log.match_id:
+        append_kda_event(db, riot_profile.id, info, previous_kda_ratio=log.kda_ratio)
+
     log.match_id = info["match_id"]
     log.kda_ratio = info["kda"]
     log.timestamp = info["timestamp"]
@@ -73,4 +78,7 @@ def build_league_of_graphs_url(match_id: str):
     except (KeyError, ValueError):
         return None
 
-
+def build_negative_message(game_name: str, tagline: str, match_id: str):
+    return (f"{game_name}#{tagline} just went negative. "
+            f"You can view the match here: "
+            f"{build_league_of_graphs_url(match_id)}")
@@ -1,30 +1,35 @@
+import asyncio
+import threading
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query
 from pydantic import BaseModel, EmailStr, ConfigDict
 from datetime import datetime
 from typing import Annotated, Optional
 from src.database import models
-from src.database.database import engine, SessionLocal
+from src.database.database import SessionLocal
+from sqlalchemy import not_
 from sqlalchemy.orm import Session
-import uuid, os
+import uuid
 from src.negative_lol.riot_get_info import get_puuid
-from dotenv import load_dotenv
 from src.database.kda_helper import create_kda_log_for_profile, update_kda_log_for_profile
-from scheduler.scheduler import start_scheduler, stop_scheduler
+from src.database.events import read_kda_events
+from src.database.cache import (get_user_by_auth_id, get_riot_profile, get_kda_log, invalidate_riot_profile,
+                                 invalidate_from_kda_events, cache_stats)
+from src.config import RIOT_API_KEY as api_key
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    start_scheduler()
-    print("Scheduler started")
+    # drops cache entries for matches the polling worker ingests
+    stop_event = threading.Event()
+    invalidator = threading.Thread(target=invalidate_from_kda_events, args=(stop_event,), daemon=True)
+    invalidator.start()
     yield
-    stop_scheduler()
+    stop_event.set()
+    await asyncio.to_thread(invalidator.join)
 
+# schema is managed by alembic (alembic upgrade head), not created on import
 app=FastAPI(lifespan=lifespan)
-models.Base.metadata.create_all(bind=engine)
-
-load_dotenv()
-api_key = os.getenv('RIOT_API_KEY')
 
 class UserCreate(BaseModel):
     email: Optional[EmailStr]
@@ -92,7 +97,7 @@ async def create_user(user: UserCreate, db: db_dependency):
 
 @app.post("/riot_profile/create")
 async def create_riot_profile(profile: RiotProfileCreate, db: db_dependency):
-    user = db.query(models.User).filter(models.User.auth_id == profile.auth_id).first()
+    user = get_user_by_auth_id(db, profile.auth_id)
     if not user:
         raise HTTPException(status_code=404, detail="Authorization not found")
 
@@ -120,37 +125,38 @@ async def create_riot_profile(profile: RiotProfileCreate, db: db_dependency):
         db.commit()
 
     create_kda_log_for_profile(riot_profile=riot_profile, db=db)
+    invalidate_riot_profile(riot_profile.id)
 
     return {"id": riot_profile.id, "message": "Riot Profile created"}
 
 @app.put("/riot_profile/switch_active")
 async def switch_active(profile: RiotProfileSwitchActive, db: db_dependency):
-    riot_profile = db.query(models.RiotProfile).filter(models.RiotProfile.id == profile.id).first()
-    if not riot_profile:
+    # flipped in a single UPDATE so the toggle never depends on a cached (possibly stale) read
+    updated = (db.query(models.RiotProfile)
+               .filter(models.RiotProfile.id == profile.id)
+               .update({models.RiotProfile.active: not_(models.RiotProfile.active)},
+                       synchronize_session=False))
+    if not updated:
         raise HTTPException(status_code=404, detail="Cannot find Riot Profile")
 
-    if riot_profile.active:
-        riot_profile.active = False
-    else:
-        riot_profile.active = True
-
     db.commit()
-    db.refresh(riot_profile)
+    invalidate_riot_profile(profile.id)
 
-    return {"id": riot_profile.id, "message": "Riot Profile active switched"}
+    return {"id": profile.id, "message": "Riot Profile active switched"}
 
 
 @app.post("/kda_logs/create")
 async def create_kda_log(log: KDALogCreate, db: db_dependency):
-    riot_profile = db.query(models.RiotProfile).filter(models.RiotProfile.id == log.riot_profile_id).first()
+    riot_profile = get_riot_profile(db, log.riot_profile_id)
     if not riot_profile:
         raise HTTPException(status_code=404, detail="Riot profile not found")
 
-    existing_log = db.query(models.KDALog).filter_by(riot_profile_id=riot_profile.id).first()
+    existing_log = get_kda_log(db, riot_profile.id)
     if existing_log:
         raise HTTPException(status_code=400, detail="KDA Log already exists for this profile")
 
     kda_log = create_kda_log_for_profile(riot_profile, db)
+    invalidate_riot_profile(riot_profile.id)
 
     return {"id": kda_log.id, "message": "KDA Log created"}
 
@@ -163,7 +169,7 @@ for profile in active_profiles:
 @app.put("/kda_logs/update")
 async def update_kda_log(log_update: KDALogUpdate, db: db_dependency):
     # we are given riot_profile_id
-    riot_profile = db.query(models.RiotProfile).filter(models.RiotProfile.id == log_update.riot_profile_id).first()
+    riot_profile = get_riot_profile(db, log_update.riot_profile_id)
     if not riot_profile:
         raise HTTPException(status_code=404, detail="Riot profile not found")
 
@@ -171,12 +177,25 @@ async def update_kda_log(log_update: KDALogUpdate, db: db_dependency):
         log = update_kda_log_for_profile(riot_profile, db)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    invalidate_riot_profile(riot_profile.id)
 
     return {"id": log.id, "message": "KDA Log updated"}
 
 @app.get("/kda_logs/read/{riot_profile_id}")
 async def read_kda_logs(riot_profile_id: int, db: db_dependency):
-    result = db.query(models.KDALog).filter(models.KDALog.riot_profile_id == riot_profile_id).first()
+    result = get_kda_log(db, riot_profile_id)
     if not result:
         raise HTTPException(status_code=404, detail="KDALog not found")
-    return result
\ No newline at end of file
+    return result
+
+# dashboard feed: pass the returned cursor back as `after` to get only newer events
+@app.get("/kda_events/read/{riot_profile_id}")
+async def read_kda_events_for_profile(riot_profile_id: int, db: db_dependency,
+                                      after: Annotated[int, Query(ge=0)] = 0,
+                                      limit: Annotated[int, Query(ge=1, le=100)] = 50):
+    events = read_kda_events(db, after, limit, riot_profile_id=riot_profile_id)
+    return {"events": events, "cursor": events[-1].id if events else after}
+
+@app.get("/cache/stats")
+async def read_cache_stats():
+    return cache_stats()
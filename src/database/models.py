@@ -1,6 +1,6 @@
 from sqlalchemy import (Column, Integer, String,
                         ForeignKey, DateTime, Float,
-                        UniqueConstraint, Boolean, Table)
+                        UniqueConstraint, Boolean, Table, func)
 from sqlalchemy.orm import relationship
 from src.database.database import Base
 from datetime import datetime, timezone
@@ -78,3 +78,37 @@ class KDALog(Base):
     timestamp = Column(DateTime)
 
     riot_profiles = relationship("RiotProfile", back_populates="kda_logs")
+
+'''
+kda_events (append-only outbox, one row per newly ingested match)
+----------
+id (PK, consumers tail by id)
+riot_profile_id (FK)
+match_id
+kda_ratio
+previous_kda_ratio (null for a profile's first match)
+timestamp
+created_at (database clock at insert, not transaction start)
+'''
+class KDAEvent(Base):
+    __tablename__ = "kda_events"
+
+    id = Column(Integer, primary_key=True)
+    riot_profile_id = Column(Integer, ForeignKey("riot_profiles.id"), index=True, nullable=False)
+    match_id = Column(String)
+    kda_ratio = Column(Float)
+    previous_kda_ratio = Column(Float)
+    timestamp = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.statement_timestamp())
+
+'''
+event_cursors
+-------------
+consumer (PK, e.g. "notifications")
+last_event_id (last kda_events.id the consumer has handled)
+'''
+class EventCursor(Base):
+    __tablename__ = "event_cursors"
+
+    consumer = Column(String, primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
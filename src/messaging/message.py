@@ -1,6 +1,4 @@
-import os
-from dotenv import load_dotenv
-from twilio.rest import Client
+from functools import lru_cache
 '''
 load_dotenv()
 
@@ -14,8 +12,14 @@ message = client.messages.create(
     to=os.getenv("TWILIO_VIRTUAL_NUMBER"))
 
 '''
+# twilio.rest is slow to import, so it is only loaded (and the client built) on first send
+@lru_cache(maxsize=None)
+def get_client(account_sid, auth_token):
+    from twilio.rest import Client
+    return Client(account_sid, auth_token)
+
 def send_message(from_, to, message, account_sid, auth_token):
-    Client(account_sid, auth_token).messages.create(
+    get_client(account_sid, auth_token).messages.create(
         from_=from_,
         to=to,
         body=message
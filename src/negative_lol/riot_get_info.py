@@ -1,14 +1,16 @@
-import os
-import requests
-from dotenv import load_dotenv
 import datetime
 
-load_dotenv()
-api_key_priv = os.getenv('RIOT_API_KEY')
+REQUEST_TIMEOUT_SECONDS = 10
+
+# requests is imported on first call rather than at startup; the timeout keeps a
+# stuck riot call from hanging a worker fetch thread (and its shutdown) forever
+def _get(api_url: str):
+    import requests
+    return requests.get(api_url, timeout=REQUEST_TIMEOUT_SECONDS)
 
 def get_puuid(game_name: str, tagline: str, region: str, api_key: str) -> str:
     api_url = f"https://{region}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tagline}?api_key={api_key}"
-    resp = requests.get(api_url)
+    resp = _get(api_url)
     if resp.status_code != 200:
         raise Exception(f"Error fetching PUUID: {resp.status_code} {resp.text}")
 
@@ -21,7 +23,7 @@ def get_x_match_ids(puuid: str, region: str, api_key: str, count: int) -> list[s
     if (count <= 0 or count > 100):
         raise Exception("Invalid count value, must be between 0 and 100")
     api_url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count={count}&api_key={api_key}"
-    resp = requests.get(api_url)
+    resp = _get(api_url)
     if resp.status_code != 200:
         raise Exception(f"Error fetching match IDs: {resp.status_code} {resp.text}")
     match_ids = resp.json()
@@ -29,7 +31,7 @@ def get_x_match_ids(puuid: str, region: str, api_key: str, count: int) -> list[s
 
 def get_last_match_id(puuid: str, region: str, api_key: str) -> str:
     api_url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count=1&api_key={api_key}"
-    resp = requests.get(api_url)
+    resp = _get(api_url)
     if resp.status_code != 200:
         raise Exception(f"Error fetching match IDs: {resp.status_code} {resp.text}")
     match_id = resp.json()
@@ -37,7 +39,7 @@ def get_last_match_id(puuid: str, region: str, api_key: str) -> str:
 
 def get_match_data(match_id: str, region: str, api_key: str) -> dict:
     api_url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}?api_key={api_key}"
-    resp = requests.get(api_url)
+    resp = _get(api_url)
     if resp.status_code != 200:
         raise Exception(f"Error fetching match data: {resp.status_code} {resp.text}")
     match_data = resp.json()
@@ -0,0 +1,100 @@
+import signal
+import sys
+import threading
+from src.database.database import SessionLocal
+from src.database import models
+from src.database.events import read_kda_events, get_cursor
+from src.database.kda_helper import build_negative_message
+from src.messaging.message import send_message
+from src.config import (TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_MY_NUMBER, TWILIO_VIRTUAL_NUMBER,
+                        EVENT_BATCH_SIZE, EVENT_POLL_SECONDS)
+
+'''
+Consumers of the kda_events outbox, each run as its own process:
+python -m src.worker.consumers notifications
+
+A consumer reads a batch of events past its cursor and handles them one at a
+time, committing the cursor after each event. A handler that fails is logged
+and skipped, like the old scheduler did, so one bad event can't block the
+stream or cause the events before it to be handled again. An event is only
+handled twice if the process dies between handling it and committing.
+'''
+def notify_negative_match(db, event: models.KDAEvent):
+    if event.previous_kda_ratio is None:
+        return
+    if event.kda_ratio != event.previous_kda_ratio and event.kda_ratio < 1:
+        profile = db.get(models.RiotProfile, event.riot_profile_id)
+        send_message(from_=TWILIO_MY_NUMBER,
+                     to=TWILIO_VIRTUAL_NUMBER,
+                     message=build_negative_message(profile.game_name, profile.tagline, event.match_id),
+                     account_sid=TWILIO_ACCOUNT_SID,
+                     auth_token=TWILIO_AUTH_TOKEN
+                     )
+
+CONSUMERS = {
+    "notifications": notify_negative_match,
+}
+
+def consume_batch(consumer: str, handler, batch_size: int = EVENT_BATCH_SIZE) -> int:
+    db = SessionLocal()
+    # events stay loaded across the per-event commits below
+    db.expire_on_commit = False
+    try:
+        cursor = get_cursor(db, consumer)
+        events = read_kda_events(db, cursor.last_event_id, batch_size)
+        db.commit()
+
+        for event in events:
+            cursor = get_cursor(db, consumer)
+            # another instance of this consumer got here first
+            if cursor.last_event_id >= event.id:
+                db.rollback()
+                break
+
+            try:
+                handler(db, event)
+            except Exception as e:
+                print(f"[Consumer] {consumer} failed for event {event.id}, skipping: {e}")
+                # the failure may have aborted the transaction, so retake the cursor in a fresh one
+                db.rollback()
+                cursor = get_cursor(db, consumer)
+                if cursor.last_event_id >= event.id:
+                    db.rollback()
+                    break
+
+            cursor.last_event_id = event.id
+            db.commit()
+        return len(events)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def run_consumer(consumer: str, stop_event: threading.Event, interval: float = EVENT_POLL_SECONDS):
+    handler = CONSUMERS[consumer]
+    while not stop_event.is_set():
+        try:
+            # keep reading without waiting while there is a backlog
+            if consume_batch(consumer, handler) == EVENT_BATCH_SIZE:
+                continue
+        except Exception as e:
+            print(f"[Consumer] {consumer} failed: {e}")
+        stop_event.wait(interval)
+
+
+def main(argv: list[str]):
+    if len(argv) != 1 or argv[0] not in CONSUMERS:
+        print(f"Usage: python -m src.worker.consumers <{'|'.join(CONSUMERS)}>")
+        sys.exit(1)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    print(f"Consumer {argv[0]} started")
+    run_consumer(argv[0], stop_event)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
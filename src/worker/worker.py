@@ -0,0 +1,163 @@
+import queue
+import signal
+import threading
+import time
+from sqlalchemy.orm import joinedload
+from src.database.database import SessionLocal
+from src.database import models
+from src.database.kda_helper import save_kda_log_for_profile
+from src.negative_lol.riot_get_info import get_all_from_names
+from src.config import RIOT_API_KEY as api_key, POLL_INTERVAL_SECONDS, WORKER_QUEUE_SIZE, WORKER_FETCH_THREADS
+
+_STOP = object()
+
+'''
+Polling worker, run as its own process: python -m src.worker.worker
+
+select due profiles -> fetch -> persist
+
+Notifications are not sent from here: persist appends a kda_events row for each
+new match and the consumers in src.worker.consumers handle it from there.
+
+Each stage runs on its own thread(s) and hands jobs to the next through a
+bounded queue, so a slow stage blocks the ones before it instead of piling up
+work. Every active profile is selected once per interval. A profile whose
+previous job hasn't left the pipeline yet is skipped, so ticks never overlap
+for the same profile.
+
+On SIGINT/SIGTERM selection stops, the remaining jobs are drained through every
+stage, and the process exits.
+'''
+class Pipeline:
+    def __init__(self, interval: float = POLL_INTERVAL_SECONDS, queue_size: int = WORKER_QUEUE_SIZE,
+                 fetch_threads: int = WORKER_FETCH_THREADS):
+        self.interval = interval
+        self.fetch_threads = fetch_threads
+        self.stop_event = threading.Event()
+
+        self.fetch_queue = queue.Queue(maxsize=queue_size)
+        self.persist_queue = queue.Queue(maxsize=queue_size)
+
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+
+        self._selector = threading.Thread(target=self.select_due_profiles, name="select")
+        self._stages = [
+            ([self._stage_thread("fetch", self.fetch_queue, self.persist_queue, self.fetch)
+              for _ in range(fetch_threads)], self.persist_queue),
+            ([self._stage_thread("persist", self.persist_queue, None, self.persist)], None),
+        ]
+
+    def start(self):
+        for threads, _ in self._stages:
+            for thread in threads:
+                thread.start()
+        self._selector.start()
+
+    def shutdown(self):
+        self.stop_event.set()
+        self._selector.join()
+
+        # drain stage by stage: every thread of a stage gets a sentinel, and the
+        # next stage is only stopped once all of them have finished
+        in_queue = self.fetch_queue
+        for threads, out_queue in self._stages:
+            for _ in threads:
+                in_queue.put(_STOP)
+            for thread in threads:
+                thread.join()
+            in_queue = out_queue
+
+    def _stage_thread(self, name, in_queue, out_queue, fn):
+        return threading.Thread(target=self._run_stage, args=(name, in_queue, out_queue, fn), name=name)
+
+    def _run_stage(self, name, in_queue, out_queue, fn):
+        while True:
+            job = in_queue.get()
+            if job is _STOP:
+                return
+
+            try:
+                result = fn(job)
+            except Exception as e:
+                print(f"[Worker] {name} failed for profile {job['id']}: {e}")
+                result = None
+
+            # None means the job is finished (or dropped) and leaves the pipeline
+            if result is None or out_queue is None:
+                self._release(job["id"])
+            else:
+                out_queue.put(result)
+
+    def _release(self, profile_id: int):
+        with self._in_flight_lock:
+            self._in_flight.discard(profile_id)
+
+    def select_due_profiles(self):
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            try:
+                for job in self._due_jobs():
+                    if self.stop_event.is_set():
+                        break
+                    # blocks while fetch is saturated
+                    self.fetch_queue.put(job)
+            except Exception as e:
+                print(f"[Worker] select failed: {e}")
+            # ticks start every interval, however long enqueuing took
+            self.stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _due_jobs(self) -> list[dict]:
+        db = SessionLocal()
+        try:
+            profiles = (db.query(models.RiotProfile)
+                        .options(joinedload(models.RiotProfile.kda_logs))
+                        .filter(models.RiotProfile.active == True)
+                        .all())
+
+            jobs = []
+            with self._in_flight_lock:
+                for profile in profiles:
+                    if profile.id in self._in_flight or not profile.kda_logs:
+                        continue
+                    self._in_flight.add(profile.id)
+                    jobs.append({
+                        "id": profile.id,
+                        "game_name": profile.game_name,
+                        "tagline": profile.tagline,
+                        "region": profile.region,
+                    })
+            return jobs
+        finally:
+            db.close()
+
+    def fetch(self, job: dict) -> dict:
+        job["info"] = get_all_from_names(job["game_name"], job["tagline"], job["region"], api_key)
+        return job
+
+    def persist(self, job: dict):
+        db = SessionLocal()
+        try:
+            profile = db.get(models.RiotProfile, job["id"])
+            if profile:
+                save_kda_log_for_profile(profile, job["info"], db)
+        finally:
+            db.close()
+
+
+def main():
+    pipeline = Pipeline()
+    signal.signal(signal.SIGINT, lambda *_: pipeline.stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: pipeline.stop_event.set())
+
+    pipeline.start()
+    print("Worker started")
+    while not pipeline.stop_event.is_set():
+        pipeline.stop_event.wait(1)
+
+    print("Worker shutting down")
+    pipeline.shutdown()
+
+
+if __name__ == "__main__":
+    main()